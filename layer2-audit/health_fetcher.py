@@ -11,9 +11,17 @@ Goals:
 from __future__ import annotations
 
 import argparse
+import concurrent.futures
 import datetime as dt
+import functools
+import itertools
 import json
+import mmap
+import operator
+import os
 import re
+import sys
+from collections import deque
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Iterable
@@ -23,6 +31,14 @@ try:
 except Exception:  # pragma: no cover
     ZoneInfo = None  # type: ignore
 
+try:
+    import orjson  # optional; 2-3x faster than stdlib json
+except Exception:  # pragma: no cover
+    orjson = None  # type: ignore
+
+# Both accept bytes, so callers can hand over raw file contents without decoding first.
+_json_loads = orjson.loads if orjson is not None else json.loads
+
 
 STATE_DIR = Path.home() / ".openclaw"
 CONFIG_FILE = STATE_DIR / "openclaw.json"
@@ -30,24 +46,103 @@ LOG_DIR = STATE_DIR / "logs"
 GATEWAY_LOG = LOG_DIR / "gateway.log"
 ERROR_LOG = LOG_DIR / "gateway.err.log"
 WATCHDOG_AUDIT = STATE_DIR / "guardian" / "watchdog-audit.jsonl"
+RUNTIME_PATHS_CACHE = STATE_DIR / "guardian" / "runtime-paths.json"
 CRON_JOBS = STATE_DIR / "cron" / "jobs.json"
 
+_UTC = dt.timezone.utc
+
 
 TS_RE = re.compile(r"(?P<ts>\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(?:\.\d+)?Z)")
 PROVIDER_MODEL_RE = re.compile(r"\bprovider=(?P<provider>[\w-]+)\b.*\bmodel=(?P<model>[\w.\-]+)\b")
-UNKNOWN_MODEL_RE = re.compile(r"Unknown model:\s*(?P<model>[\w\-./]+)")
 MODEL_QUOTED_RE = re.compile(r'Model\s+"(?P<model>[\w\-./]+)"')
 NO_API_KEY_RE = re.compile(r'No API key found for provider\s+"(?P<provider>[\w-]+)"')
+UNKNOWN_MODEL_RE = re.compile(r"Unknown model:\s*(?P<model>[\w\-./]+)")
 MODEL_NOT_ALLOWED_RE = re.compile(r'Model\s+"(?P<model>[\w\-./]+)"\s+is not allowed')
-RESET_AFTER_RE = re.compile(r"reset after (?P<after>(?:\d+h)?(?:\d+m)?(?:\d+s)?)", re.IGNORECASE)
-COOLDOWN_PROVIDER_RE = re.compile(r"\bProvider\s+(?P<provider>[\w-]+)\s+is\s+in\s+cooldown\b", re.IGNORECASE)
-CAPACITY_EXHAUSTED_RE = re.compile(r"exhausted your capacity on this model", re.IGNORECASE)
-CONTEXT_LIMIT_RE = re.compile(r"(context length|max(?:imum)? tokens|token limit|too many tokens)", re.IGNORECASE)
-ALL_MODELS_FAILED_BODY_RE = re.compile(r"all models failed\s*\(\d+\)\s*:\s*(?P<body>.*)$", re.IGNORECASE)
-QUOTA_RESET_RE = re.compile(r"quota will reset after (?P<after>(?:\d+h)?(?:\d+m)?(?:\d+s)?)", re.IGNORECASE)
-RPM_HINT_RE = re.compile(r"(rpm|requests per minute|too many requests|rate limit exceeded)", re.IGNORECASE)
-LANE_AGENT_RE = re.compile(r"\blane=session:agent:(?P<agent>[^:]+):", re.IGNORECASE)
-AGENT_DIR_RE = re.compile(r"/\.openclaw/agents/(?P<agent>[^/]+)/", re.IGNORECASE)
+# The patterns below are lowercase and run against the already-lowercased line (no IGNORECASE,
+# which costs sre its literal fast paths). Case-sensitive captures are sliced from the original.
+RESET_AFTER_RE = re.compile(r"reset after (?P<after>(?:\d+h)?(?:\d+m)?(?:\d+s)?)", re.ASCII)
+COOLDOWN_PROVIDER_RE = re.compile(r"\bprovider\s+(?P<provider>[\w-]+)\s+is\s+in\s+cooldown\b", re.ASCII)
+CAPACITY_EXHAUSTED_RE = re.compile(r"exhausted your capacity on this model", re.ASCII)
+# Context-limit hints are a plain keyword set, so classification checks the literal tuple directly.
+CONTEXT_LIMIT_LITERALS = ("context length", "token limit", "max tokens", "maximum tokens", "too many tokens")
+ALL_MODELS_FAILED_BODY_RE = re.compile(r"all models failed\s*\(\d+\)\s*:\s*(?P<body>.*)$", re.ASCII)
+QUOTA_RESET_RE = re.compile(r"quota will reset after (?P<after>(?:\d+h)?(?:\d+m)?(?:\d+s)?)", re.ASCII)
+LANE_AGENT_RE = re.compile(r"\blane=session:agent:(?P<agent>[^:]+):", re.ASCII)
+AGENT_DIR_RE = re.compile(r"/\.openclaw/agents/(?P<agent>[^/]+)/", re.ASCII)
+LOG_FILE_PATH_RE = re.compile(r"log file:\s*(?P<path>/\S+)")
+
+# Checked in order against the lowercased line; the first trigger present selects the reason, so a
+# line mentioning several keeps the most specific one.
+RESTART_TRIGGERS = (
+    ("received sigusr1; restarting", "用户配置变更 (SIGUSR1)"),
+    ("received sigterm; shutting down", "系统/服务重启 (SIGTERM)"),
+    ("uncaught exception", "异常退出/崩溃"),
+    ("max reconnect attempts", "异常退出/崩溃"),
+)
+
+# Lowercase literals that must occur in a line for the regex to match. Most log lines carry
+# none of them, so a plain substring check lets us skip the regex engine entirely.
+REGEX_TRIGGERS: dict[re.Pattern[str], tuple[str, ...]] = {
+    PROVIDER_MODEL_RE: ("provider=",),
+    MODEL_QUOTED_RE: ("model",),
+    NO_API_KEY_RE: ("no api key",),
+    UNKNOWN_MODEL_RE: ("unknown model:",),
+    MODEL_NOT_ALLOWED_RE: ("is not allowed",),
+    RESET_AFTER_RE: ("reset after",),
+    COOLDOWN_PROVIDER_RE: ("cooldown",),
+    CAPACITY_EXHAUSTED_RE: ("exhausted your capacity",),
+    ALL_MODELS_FAILED_BODY_RE: ("all models failed",),
+    QUOTA_RESET_RE: ("quota will reset",),
+    LANE_AGENT_RE: ("lane=session:agent:",),
+    AGENT_DIR_RE: ("/.openclaw/agents/",),
+}
+
+# Every incident branch in parse_llm_status needs at least one of these in the lowercased line;
+# lines with none of them are dropped before timestamp parsing or any regex work.
+INCIDENT_LITERALS = (
+    "model",
+    "provider=",
+    "no api key",
+    "cooldown",
+    "429",
+    "rate_limit",
+    "exhausted your capacity",
+    "timeout",
+    "etimedout",
+) + CONTEXT_LIMIT_LITERALS
+
+# Incident taxonomy for per-model errors; the values double as the "kind" shown in diagnoses.
+INCIDENT_COOLDOWN = "cooldown"
+INCIDENT_RATE_LIMIT = "429/rate_limit"
+INCIDENT_TIMEOUT = "timeout"
+INCIDENT_CONTEXT_LIMIT = "token/context limit"
+
+
+def _search(rx: re.Pattern[str], text: str, lowered: str) -> re.Match[str] | None:
+    """rx.search(text), skipped when none of the regex's trigger literals occur in `lowered`."""
+    for trigger in REGEX_TRIGGERS[rx]:
+        if trigger in lowered:
+            return rx.search(text)
+    return None
+
+
+_ASCII_LOWER = str.maketrans("ABCDEFGHIJKLMNOPQRSTUVWXYZ", "abcdefghijklmnopqrstuvwxyz")
+
+
+def _lower(line: str) -> str:
+    """line.lower(), guaranteed to keep every character at the same offset as in `line`."""
+    lowered = line.lower()
+    # A handful of non-ASCII letters grow when lowercased; fall back to ASCII-only folding then.
+    return lowered if len(lowered) == len(line) else line.translate(_ASCII_LOWER)
+
+
+def _orig_group(line: str, m: re.Match[str], name: str) -> str:
+    """Group `name` of a match found in _lower(line), with the original casing."""
+    return line[m.start(name) : m.end(name)]
+
+
+def _has_any(lowered: str, literals: tuple[str, ...]) -> bool:
+    return any(x in lowered for x in literals)
 
 
 def _parse_hms_duration(s: str) -> dt.timedelta | None:
@@ -58,19 +153,31 @@ def _parse_hms_duration(s: str) -> dt.timedelta | None:
     raw = (s or "").strip().lower()
     if not raw:
         return None
-    m = re.fullmatch(r"(?:(?P<h>\d+)h)?(?:(?P<m>\d+)m)?(?:(?P<s>\d+)s)?", raw)
-    if not m:
+    # Hand-rolled scan: each unit at most once, in h/m/s order, each preceded by digits.
+    parts = [0, 0, 0]
+    last = -1
+    n = -1
+    for c in raw:
+        if "0" <= c <= "9":
+            n = max(n, 0) * 10 + (ord(c) - 48)
+            continue
+        unit = "hms".find(c)
+        if n < 0 or unit <= last:
+            return None
+        parts[unit] = n
+        last = unit
+        n = -1
+    if n >= 0:
         return None
-    h = int(m.group("h") or 0)
-    mm = int(m.group("m") or 0)
-    ss = int(m.group("s") or 0)
+    h, mm, ss = parts
     if h == 0 and mm == 0 and ss == 0:
         return None
     return dt.timedelta(hours=h, minutes=mm, seconds=ss)
 
 
-def _reset_after_from_text(text: str) -> tuple[dt.timedelta, str] | None:
-    m = RESET_AFTER_RE.search(text) or QUOTA_RESET_RE.search(text)
+def _reset_after_from_text(lowered: str) -> tuple[dt.timedelta, str] | None:
+    # `lowered` must already be lowercased, like every line fed to the reset-after patterns.
+    m = _search(RESET_AFTER_RE, lowered, lowered) or _search(QUOTA_RESET_RE, lowered, lowered)
     if not m:
         return None
     raw = (m.group("after") or "").strip()
@@ -82,16 +189,73 @@ def _reset_after_from_text(text: str) -> tuple[dt.timedelta, str] | None:
 
 def _read_json(path: Path) -> dict[str, Any] | None:
     try:
-        return json.loads(path.read_text())
+        return _json_loads(path.read_bytes())
     except Exception:
         return None
 
 
-def _parse_ts_utc(line: str) -> dt.datetime | None:
+def _leading_stamp_end(line: str) -> int:
+    """
+    Offset just past the "Z" of a leading "YYYY-MM-DDTHH:MM:SS[.fff]Z" stamp, or 0 when the line has none.
+
+    Every field must be ASCII digits: str.isdigit() alone also accepts "²" or "①", and int() on the
+    bare slices would accept signs and spaces that TS_RE rejects.
+    """
+    if not (
+        len(line) >= 20
+        and line[4] == "-"
+        and line[7] == "-"
+        and line[10] == "T"
+        and line[13] == ":"
+        and line[16] == ":"
+        and line[:19].isascii()
+        and line[0:4].isdigit()
+        and line[5:7].isdigit()
+        and line[8:10].isdigit()
+        and line[11:13].isdigit()
+        and line[14:16].isdigit()
+        and line[17:19].isdigit()
+    ):
+        return 0
+    tail = line[19]
+    if tail == "Z":
+        return 20
+    if tail == ".":
+        z = line.find("Z", 20, 30)
+        frac = line[20:z]
+        if z > 20 and frac.isascii() and frac.isdigit():
+            return z + 1
+    return 0
+
+
+def _parse_ts_utc(line: str | bytes) -> dt.datetime | None:
+    if isinstance(line, bytes):
+        # Every accepted stamp ends in "Z"; don't pay for decoding lines that cannot carry one.
+        if b"Z" not in line:
+            return None
+        line = line.decode("utf-8", "replace")
+    # Fast path: OpenClaw lines start with a fixed-width stamp, e.g. 2026-02-07T02:28:57.903Z
+    end = _leading_stamp_end(line)
+    if end:
+        try:
+            return dt.datetime(
+                int(line[0:4]),
+                int(line[5:7]),
+                int(line[8:10]),
+                int(line[11:13]),
+                int(line[14:16]),
+                int(line[17:19]),
+                int(line[20 : end - 1][:6].ljust(6, "0")) if end > 20 else 0,
+                tzinfo=_UTC,
+            )
+        except ValueError:
+            pass
+    # Slow path: stamp somewhere else in the line (which still has to carry the "Z").
+    if "Z" not in line:
+        return None
     m = TS_RE.search(line)
     if not m:
         return None
-    # Example: 2026-02-07T02:28:57.903Z
     raw = m.group("ts").replace("Z", "+00:00")
     try:
         return dt.datetime.fromisoformat(raw)
@@ -99,6 +263,27 @@ def _parse_ts_utc(line: str) -> dt.datetime | None:
         return None
 
 
+@functools.lru_cache(maxsize=4096)
+def _stamp_epoch(stamp: str) -> int | None:
+    ts = _parse_ts_utc(stamp + "Z")
+    return int(ts.timestamp()) if ts else None
+
+
+def _parse_ts_epoch(line: str) -> int | None:
+    """
+    Whole UTC epoch seconds of the line's stamp, accepting exactly what _parse_ts_utc accepts.
+
+    Bursts of log lines share a second, so standard leading stamps are converted once per
+    "YYYY-MM-DDTHH:MM:SS" prefix and never build a datetime per line.
+    """
+    if _leading_stamp_end(line):
+        epoch = _stamp_epoch(line[:19])
+        if epoch is not None:
+            return epoch
+    ts = _parse_ts_utc(line)
+    return int(ts.timestamp()) if ts else None
+
+
 def _resolve_tz(config: dict[str, Any] | None, tz_name: str | None) -> dt.tzinfo:
     if tz_name:
         name = tz_name
@@ -121,26 +306,152 @@ def _resolve_tz(config: dict[str, Any] | None, tz_name: str | None) -> dt.tzinfo
         return ZoneInfo("Asia/Shanghai")
 
 
+@functools.lru_cache(maxsize=4096)
+def _fmt_local_minute(epoch_minute: int, tz: dt.tzinfo) -> str:
+    return dt.datetime.fromtimestamp(epoch_minute * 60, tz).strftime("%H:%M")
+
+
 def _fmt_local(ts_utc: dt.datetime, tz: dt.tzinfo, fmt: str = "%H:%M") -> str:
     if ts_utc.tzinfo is None:
         ts_utc = ts_utc.replace(tzinfo=dt.timezone.utc)
+    if fmt == "%H:%M":
+        # Bursts of log lines share a minute; convert each minute only once.
+        return _fmt_local_minute(int(ts_utc.timestamp() // 60), tz)
     return ts_utc.astimezone(tz).strftime(fmt)
 
 
-def get_recent_lines(path: Path, since_utc: dt.datetime) -> list[str]:
-    if not path.exists():
-        return []
-    out: list[str] = []
+def _reverse_lines(mm: mmap.mmap) -> Iterable[bytes]:
+    """Raw lines of a mapped file, last line first."""
+    end = len(mm)
+    while end > 0:
+        start = mm.rfind(b"\n", 0, end) + 1
+        yield mm[start:end]
+        end = start - 1
+
+
+def _stamp_prefix(raw: bytes) -> bytes | None:
+    """
+    Leading "YYYY-MM-DDTHH:MM:SS" of a raw log line when it has the standard UTC stamp shape.
+
+    Same shape test as _leading_stamp_end (bytes.isdigit() is ASCII-only), so a stamp with a local
+    offset such as "+08:00" is never compared against a UTC window bound.
+    """
+    if not (
+        len(raw) >= 20
+        and raw[4:5] == b"-"
+        and raw[7:8] == b"-"
+        and raw[10:11] == b"T"
+        and raw[13:14] == b":"
+        and raw[16:17] == b":"
+        and raw[0:4].isdigit()
+        and raw[5:7].isdigit()
+        and raw[8:10].isdigit()
+        and raw[11:13].isdigit()
+        and raw[14:16].isdigit()
+        and raw[17:19].isdigit()
+    ):
+        return None
+    tail = raw[19:20]
+    if tail == b"Z":
+        return raw[:19]
+    if tail == b".":
+        z = raw.find(b"Z", 20, 30)
+        if z > 20 and raw[20:z].isdigit():
+            return raw[:19]
+    return None
+
+
+def _first_offset_since(mm: mmap.mmap, since_key: bytes) -> int:
+    """
+    Byte offset of a line start at or before the first line stamped `since_key` or later.
+
+    Logs are append-only, so stamps are (near) sorted by offset and we can bisect on them: probe the
+    line under the midpoint, skip forward past unstamped continuation lines to the next stamp, and
+    narrow towards the boundary. Unstamped and equal-second lines only ever move the result earlier.
+    """
+    lo, hi = 0, len(mm)
+    while lo < hi:
+        start = mm.rfind(b"\n", 0, (lo + hi) // 2) + 1
+        pos = start
+        key = None
+        while pos < hi:
+            nl = mm.find(b"\n", pos)
+            end = len(mm) if nl < 0 else nl
+            key = _stamp_prefix(mm[pos : min(end, pos + 30)])
+            if key is not None:
+                break
+            pos = end + 1
+        if key is None or key >= since_key:
+            hi = start
+        else:
+            lo = end + 1
+    return lo
+
+
+def _tail_since(path: Path, since_utc: dt.datetime) -> Iterable[str]:
+    """
+    Lazily yield lines of `path` stamped at or after `since_utc`, oldest first. Unstamped lines are dropped.
+
+    The window start is found by bisecting the mmap'd file on its fixed-width stamps, so only the
+    recent tail of a multi-MB log is ever read. Fixed-width stamps sort lexicographically, so most
+    lines are classified by comparing raw bytes against the window start and never go through
+    datetime parsing.
+    """
+    since_key = since_utc.astimezone(_UTC).strftime("%Y-%m-%dT%H:%M:%S").encode("ascii")
     try:
-        with path.open("r") as f:
-            for line in f:
-                ts = _parse_ts_utc(line)
-                if ts is None:
-                    continue
-                if ts >= since_utc:
-                    out.append(line.rstrip("\n"))
+        with path.open("rb") as f:
+            if not os.fstat(f.fileno()).st_size:
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                mm.seek(_first_offset_since(mm, since_key))
+                for raw in iter(mm.readline, b""):
+                    raw = raw.rstrip(b"\n")
+                    key = _stamp_prefix(raw)
+                    if key is not None and key < since_key:
+                        continue
+                    if key is None or key == since_key:
+                        # Unstamped continuation lines (stack traces, JSON dumps) are dropped
+                        # here without ever being decoded.
+                        ts = _parse_ts_utc(raw)
+                        if ts is None or ts < since_utc:
+                            continue
+                    yield raw.decode("utf-8", "replace").rstrip("\r")
     except Exception:
-        return []
+        return
+
+
+def get_recent_lines(path: Path, since_utc: dt.datetime) -> list[str]:
+    """Lines of `path` stamped at or after `since_utc`, oldest first (see _tail_since)."""
+    return list(_tail_since(path, since_utc))
+
+
+def _lines_since(lines: list[str], since_utc: dt.datetime) -> list[str]:
+    """
+    Narrow lines already returned by get_recent_lines() to a later, whole-second `since_utc`.
+
+    Like _first_offset_since on the file, bisect only over lines with a leading stamp (a stamp
+    embedded in a message can be arbitrarily old, so those lines don't order the log). Past the cut,
+    leading-stamped lines are in the window; the rest are checked one by one.
+    """
+    since_key = since_utc.astimezone(_UTC).strftime("%Y-%m-%dT%H:%M:%S")
+    since_epoch = int(since_utc.timestamp())
+    lo, hi = 0, len(lines)
+    while lo < hi:
+        i = (lo + hi) // 2
+        while i < hi and not _leading_stamp_end(lines[i]):
+            i += 1
+        if i == hi or lines[i][:19] >= since_key:
+            hi = (lo + hi) // 2
+        else:
+            lo = i + 1
+    out: list[str] = []
+    for line in itertools.islice(lines, lo, None):
+        if _leading_stamp_end(line):
+            out.append(line)
+        else:
+            ts_epoch = _parse_ts_epoch(line)
+            if ts_epoch is not None and ts_epoch >= since_epoch:
+                out.append(line)
     return out
 
 
@@ -155,19 +466,21 @@ def _normalize_model_id(provider: str, model: str) -> str:
     return f"{provider}/{model}"
 
 
-def _extract_provider_model(line: str) -> tuple[str | None, str | None, str | None]:
+def _extract_provider_model(line: str, lowered: str | None = None) -> tuple[str | None, str | None, str | None]:
     """
     Returns (provider, model, model_id) best-effort.
     - If log has provider/model fields, use them.
     - If log has quoted model id, use that (provider/model).
     """
-    m = PROVIDER_MODEL_RE.search(line)
+    if lowered is None:
+        lowered = line.lower()
+    m = _search(PROVIDER_MODEL_RE, line, lowered)
     if m:
         provider = m.group("provider")
         model = m.group("model")
         return provider, model, _normalize_model_id(provider, model)
 
-    mq = MODEL_QUOTED_RE.search(line)
+    mq = _search(MODEL_QUOTED_RE, line, lowered)
     if mq:
         mid = mq.group("model")
         if "/" in mid:
@@ -222,6 +535,37 @@ def get_configured_models(config: dict[str, Any]) -> list[ModelRef]:
     return out
 
 
+class _RecentEvents:
+    """
+    First occurrence of each distinct event, keeping only the newest `limit` of them.
+
+    The same is tracked separately for events appended while `in_window` is set, exactly as if only
+    those lines had been parsed; callers flip it per line to get a shorter window from one pass.
+    """
+
+    def __init__(self, limit: int) -> None:
+        self._seen: set[str] = set()
+        self._recent: deque[str] = deque(maxlen=limit)
+        self._window_seen: set[str] = set()
+        self._window: deque[str] = deque(maxlen=limit)
+        self.in_window = True
+
+    def append(self, event: str) -> None:
+        if self.in_window and event not in self._window_seen:
+            self._window_seen.add(event)
+            self._window.append(event)
+        if event in self._seen:
+            return
+        self._seen.add(event)
+        self._recent.append(event)
+
+    def tolist(self) -> list[str]:
+        return list(self._recent)
+
+    def window_tolist(self) -> list[str]:
+        return list(self._window)
+
+
 def _worse_status(a: str, b: str) -> str:
     # Order: red > yellow > green
     order = {"🔴": 3, "🟡": 2, "🟢": 1}
@@ -230,27 +574,190 @@ def _worse_status(a: str, b: str) -> str:
     return a if order.get(ea, 0) >= order.get(eb, 0) else b
 
 
-def _find_model_refs_in_line(line: str, models: list[ModelRef]) -> list[ModelRef]:
+def _model_ids_re(models: list[ModelRef]) -> re.Pattern[str] | None:
+    """One alternation over all configured model ids (longest first), so a line is scanned once."""
+    ids = sorted({m.model_id for m in models}, key=len, reverse=True)
+    if not ids:
+        return None
+    return re.compile("|".join(map(re.escape, ids)))
+
+
+def _provider_prefixes(models: list[ModelRef]) -> dict[str, str]:
+    """"provider/" prefix -> provider, for every model id that carries one."""
+    return {m.provider + "/": m.provider for m in models if "/" in m.model_id}
+
+
+def _find_model_refs_in_line(
+    line: str,
+    models: list[ModelRef],
+    model_ids_re: re.Pattern[str] | None = None,
+    provider_prefixes: dict[str, str] | None = None,
+) -> list[ModelRef]:
     # Many OpenClaw errors embed full model ids in free text:
     # "All models failed ... google-gemini-cli/gemini-3-pro-preview: ..."
+    if model_ids_re is not None and not model_ids_re.search(line):
+        return []
+    # A "provider/model" id can only match if its provider prefix is in the line; bare ids are
+    # always checked. Ids can overlap (e.g. "x/gpt-5" and "x/gpt-5-mini"), so collect every match.
+    present = None
+    if provider_prefixes is not None:
+        present = {p for prefix, p in provider_prefixes.items() if prefix in line}
     out: list[ModelRef] = []
     for m in models:
+        if present is not None and m.provider not in present and "/" in m.model_id:
+            continue
         if m.model_id in line:
             out.append(m)
     return out
 
 
+def _apply(
+    matrix: dict[str, dict[str, str]],
+    events: _RecentEvents,
+    mid: str,
+    status: str,
+    diagnosis: str,
+    event: str | None,
+) -> None:
+    if mid not in matrix:
+        if "/" in mid:
+            p, mm = mid.split("/", 1)
+        else:
+            p, mm = "unknown", mid
+        matrix[mid] = {"Provider": p, "Model": mm, "Status": "🟢 健康", "Diagnosis": "状态稳定，就绪中。"}
+    matrix[mid]["Status"] = _worse_status(matrix[mid]["Status"], status)
+    if diagnosis:
+        # Prefer non-generic diagnosis, and update when status is non-green.
+        if matrix[mid]["Diagnosis"].startswith("状态稳定") or matrix[mid]["Status"].lstrip()[:1] != "🟢":
+            matrix[mid]["Diagnosis"] = diagnosis
+    if event:
+        events.append(event)
+
+
+def _record_last(
+    last_seen: dict[str, tuple[int, str]],
+    ts_epoch: int | None,
+    mid: str,
+    kind: str,
+) -> None:
+    if ts_epoch is None:
+        return
+    prev = last_seen.get(mid)
+    if not prev or ts_epoch > prev[0]:
+        last_seen[mid] = (ts_epoch, kind)
+
+
+def _apply_incident(
+    matrix: dict[str, dict[str, str]],
+    events: _RecentEvents,
+    last_seen: dict[str, tuple[int, str]],
+    mid: str,
+    *,
+    now_epoch: int,
+    ts_epoch: int | None,
+    ts_local: str,
+    kind: str,
+    base_status: str,
+    diagnosis: str,
+    sticky_until: int | None,
+    event: str | None,
+) -> None:
+    # If incident is still "active" (sticky), apply severity; otherwise keep green but enrich diagnosis.
+    active = False
+    if ts_epoch is not None and sticky_until is not None and now_epoch < sticky_until:
+        active = True
+    if active:
+        _apply(matrix, events, mid, base_status, diagnosis, event)
+    else:
+        # Avoid falsely asserting "healthy" when we only saw an old incident.
+        # Keep status as-is, but carry the breadcrumb in diagnosis (unless already non-green).
+        if mid not in matrix:
+            _apply(matrix, events, mid, "🟢 健康", "状态稳定，就绪中。", None)
+        if matrix[mid]["Status"].lstrip()[:1] == "🟢":
+            matrix[mid]["Diagnosis"] = f"最近一次异常: [{ts_local}] {kind}（窗口外/可能已恢复，需验证）"
+        if event:
+            events.append(event)
+    _record_last(last_seen, ts_epoch, mid, kind)
+
+
+def _classify_incident(lowered: str) -> str | None:
+    """Incident kind of an error message (checked in precedence order), or None."""
+    if "cooldown" in lowered:
+        return INCIDENT_COOLDOWN
+    if "429" in lowered or "rate_limit" in lowered or _search(CAPACITY_EXHAUSTED_RE, lowered, lowered):
+        return INCIDENT_RATE_LIMIT
+    if "timeout" in lowered or "etimedout" in lowered:
+        return INCIDENT_TIMEOUT
+    if _has_any(lowered, CONTEXT_LIMIT_LITERALS):
+        return INCIDENT_CONTEXT_LIMIT
+    return None
+
+
+def _incident_details(
+    kind: str,
+    lowered: str,
+    ts_epoch: int | None,
+    *,
+    cooldown_diagnosis: str,
+    cooldown_sticky_minutes: int,
+    rate_limit_sticky_minutes: int,
+) -> tuple[str, str, int | None, str]:
+    """
+    (base_status, diagnosis, sticky_until, event text) for an incident of `kind` seen at `ts_epoch`.
+    Times are integer epoch seconds so the per-line arithmetic never allocates datetimes.
+    """
+    if kind == INCIDENT_COOLDOWN:
+        status, diag, what = "🟡 瞬时限流", cooldown_diagnosis, "cooldown"
+        sticky_secs = cooldown_sticky_minutes * 60
+    elif kind == INCIDENT_RATE_LIMIT:
+        reset_info = _reset_after_from_text(lowered)
+        reset_td = reset_info[0] if reset_info else None
+        reset_raw = reset_info[1] if reset_info else ""
+        recovery = f"预计 {reset_raw} 后重置" if reset_td and reset_raw else ""
+        # If reset-after is short, treat as RPM/短期限流; long reset implies capacity/quota exhaustion.
+        if reset_td and reset_td <= dt.timedelta(hours=1):
+            status = "🟡 429 限流"
+            diag = f"429 限流（短期/RPM 可能）。{recovery}".strip()
+        elif reset_td:
+            status = "🔴 429 配额/容量限制"
+            diag = f"429 配额/容量限制（需等待重置）。{recovery}".strip()
+        else:
+            status = "🟡 429 限流"
+            diag = "429 限流（可能是 RPM/并发）。"
+        sticky_secs = int(reset_td.total_seconds()) if reset_td else rate_limit_sticky_minutes * 60
+        what = f"429/rate_limit {recovery}".strip()
+    elif kind == INCIDENT_TIMEOUT:
+        status, diag, what = "🟡 连接超时", "timeout / ETIMEDOUT（窗口内曾出现）。", "timeout"
+        sticky_secs = 30 * 60
+    else:
+        status, diag, what = "🟡 Token/上下文上限", "Token/上下文上限触发（窗口内曾出现）。", "token/context limit"
+        sticky_secs = 6 * 3600
+    sticky_until = ts_epoch + sticky_secs if ts_epoch is not None else None
+    return status, diag, sticky_until, what
+
+
 def parse_llm_status(
     lines: Iterable[str],
     models: list[ModelRef],
     tz: dt.tzinfo,
     *,
-    now_utc: dt.datetime,
+    now_epoch: int,
     cooldown_sticky_minutes: int = 240,
     rate_limit_sticky_minutes: int = 30,
-) -> tuple[list[dict[str, str]], list[str]]:
+    recent_since_epoch: int | None = None,
+) -> tuple[list[dict[str, str]], list[str], list[str]]:
+    """
+    Returns (matrix rows, events, recent events). Recent events are those of lines stamped at or after
+    `recent_since_epoch` (all events when it is None), so a shorter deep-dive window needs no second pass.
+    Times are whole UTC epoch seconds.
+    """
     # Build a lookup so "provider=x model=y" can resolve to the exact configured model_id.
     by_provider_model: dict[tuple[str, str], ModelRef] = {(m.provider, m.model): m for m in models}
+    by_provider: dict[str, list[ModelRef]] = {}
+    for m in models:
+        by_provider.setdefault(m.provider, []).append(m)
+    model_ids_re = _model_ids_re(models)
+    provider_prefixes = _provider_prefixes(models)
 
     matrix: dict[str, dict[str, str]] = {}
     for m in models:
@@ -261,76 +768,32 @@ def parse_llm_status(
             "Diagnosis": "状态稳定，就绪中。",
         }
 
-    events: list[str] = []
-    last_seen: dict[str, tuple[dt.datetime, str]] = {}  # model_id -> (ts_utc, kind)
+    events = _RecentEvents(30)
+    last_seen: dict[str, tuple[int, str]] = {}  # model_id -> (ts epoch seconds, kind)
 
     for line in lines:
+        lowered = _lower(line)
+        if not _has_any(lowered, INCIDENT_LITERALS):
+            continue
         # If a line is explicitly about another agent (e.g., buddy), don't let it pollute main-agent health.
-        ma = LANE_AGENT_RE.search(line)
-        if ma and ma.group("agent").strip().lower() != "main":
+        ma = _search(LANE_AGENT_RE, lowered, lowered)
+        if ma and ma.group("agent").strip() != "main":
             continue
-        md = AGENT_DIR_RE.search(line)
-        if md and md.group("agent").strip().lower() != "main":
+        md = _search(AGENT_DIR_RE, lowered, lowered)
+        if md and md.group("agent").strip() != "main":
             continue
 
-        ts = _parse_ts_utc(line)
-        ts_local = _fmt_local(ts, tz) if ts else "??:??"
-        lowered = line.lower()
-
-        def apply(mid: str, status: str, diagnosis: str, event: str | None) -> None:
-            if mid not in matrix:
-                if "/" in mid:
-                    p, mm = mid.split("/", 1)
-                else:
-                    p, mm = "unknown", mid
-                matrix[mid] = {"Provider": p, "Model": mm, "Status": "🟢 健康", "Diagnosis": "状态稳定，就绪中。"}
-            matrix[mid]["Status"] = _worse_status(matrix[mid]["Status"], status)
-            if diagnosis:
-                # Prefer non-generic diagnosis, and update when status is non-green.
-                if matrix[mid]["Diagnosis"].startswith("状态稳定") or matrix[mid]["Status"].lstrip()[:1] != "🟢":
-                    matrix[mid]["Diagnosis"] = diagnosis
-            if event:
-                events.append(event)
-
-        def record_last(mid: str, kind: str) -> None:
-            if not ts:
-                return
-            prev = last_seen.get(mid)
-            if not prev or ts > prev[0]:
-                last_seen[mid] = (ts, kind)
-
-        def apply_incident(
-            mid: str,
-            *,
-            kind: str,
-            base_status: str,
-            diagnosis: str,
-            sticky_until: dt.datetime | None,
-            event: str | None,
-        ) -> None:
-            # If incident is still "active" (sticky), apply severity; otherwise keep green but enrich diagnosis.
-            active = False
-            if ts and sticky_until and now_utc < sticky_until:
-                active = True
-            if active:
-                apply(mid, base_status, diagnosis, event)
-            else:
-                # Avoid falsely asserting "healthy" when we only saw an old incident.
-                # Keep status as-is, but carry the breadcrumb in diagnosis (unless already non-green).
-                if mid not in matrix:
-                    apply(mid, "🟢 健康", "状态稳定，就绪中。", None)
-                if matrix[mid]["Status"].lstrip()[:1] == "🟢":
-                    matrix[mid]["Diagnosis"] = f"最近一次异常: [{ts_local}] {kind}（窗口外/可能已恢复，需验证）"
-                if event:
-                    events.append(event)
-            record_last(mid, kind)
+        ts_epoch = _parse_ts_epoch(line)
+        if recent_since_epoch is not None:
+            events.in_window = ts_epoch is not None and ts_epoch >= recent_since_epoch
+        ts_local = _fmt_local_minute(ts_epoch // 60, tz) if ts_epoch is not None else "??:??"
 
         # Special case: richest signal with per-model reasons in one line.
         # Example:
         #   Embedded agent failed before reply: All models failed (2): <modelId>: <msg> | <modelId>: <msg>
-        m_failed = ALL_MODELS_FAILED_BODY_RE.search(line)
+        m_failed = _search(ALL_MODELS_FAILED_BODY_RE, lowered, lowered)
         if m_failed:
-            body = m_failed.group("body")
+            body = _orig_group(line, m_failed, "body")
             for raw_seg in body.split("|"):
                 seg = raw_seg.strip()
                 if ":" not in seg:
@@ -342,95 +805,65 @@ def parse_llm_status(
                 if "/" not in mid and mid not in matrix:
                     continue
                 mlow = msg.lower()
-                reset_info = _reset_after_from_text(msg)
-                reset_td = reset_info[0] if reset_info else None
-                reset_raw = reset_info[1] if reset_info else ""
-                recovery = f"预计 {reset_raw} 后重置" if reset_td and reset_raw else ""
-
-                if "cooldown" in mlow or COOLDOWN_PROVIDER_RE.search(msg):
-                    sticky_until = ts + dt.timedelta(minutes=cooldown_sticky_minutes) if ts else None
-                    apply_incident(
-                        mid,
-                        kind="cooldown",
-                        base_status="🟡 瞬时限流",
-                        diagnosis="Provider cooldown / 瞬时限流（窗口内曾出现）。",
-                        sticky_until=sticky_until,
-                        event=f"[{ts_local}] {mid}: cooldown",
-                    )
-                elif "429" in mlow or "rate_limit" in mlow or CAPACITY_EXHAUSTED_RE.search(msg):
-                    # If reset-after is short, treat as RPM/短期限流; long reset implies capacity/quota exhaustion.
-                    if reset_td and reset_td <= dt.timedelta(hours=1):
-                        sticky_until = ts + reset_td if ts else None
-                        status = "🟡 429 限流"
-                        diag = f"429 限流（短期/RPM 可能）。{recovery}".strip()
-                    elif reset_td:
-                        sticky_until = ts + reset_td if ts else None
-                        status = "🔴 429 配额/容量限制"
-                        diag = f"429 配额/容量限制（需等待重置）。{recovery}".strip()
-                    else:
-                        sticky_until = ts + dt.timedelta(minutes=rate_limit_sticky_minutes) if ts else None
-                        status = "🟡 429 限流"
-                        diag = "429 限流（可能是 RPM/并发）。"
-                    apply_incident(
-                        mid,
-                        kind="429/rate_limit",
-                        base_status=status,
-                        diagnosis=diag,
-                        sticky_until=sticky_until,
-                        event=f"[{ts_local}] {mid}: 429/rate_limit {recovery}".strip(),
-                    )
-                elif "timeout" in mlow or "etimedout" in mlow:
-                    sticky_until = ts + dt.timedelta(minutes=30) if ts else None
-                    apply_incident(
-                        mid,
-                        kind="timeout",
-                        base_status="🟡 连接超时",
-                        diagnosis="timeout / ETIMEDOUT（窗口内曾出现）。",
-                        sticky_until=sticky_until,
-                        event=f"[{ts_local}] {mid}: timeout",
-                    )
-                elif CONTEXT_LIMIT_RE.search(msg):
-                    sticky_until = ts + dt.timedelta(hours=6) if ts else None
-                    apply_incident(
-                        mid,
-                        kind="token/context limit",
-                        base_status="🟡 Token/上下文上限",
-                        diagnosis="Token/上下文上限触发（窗口内曾出现）。",
-                        sticky_until=sticky_until,
-                        event=f"[{ts_local}] {mid}: token/context limit",
-                    )
+                kind = _classify_incident(mlow)
+                if kind is None:
+                    continue
+                status, diag, sticky_until, what = _incident_details(
+                    kind,
+                    mlow,
+                    ts_epoch,
+                    cooldown_diagnosis="Provider cooldown / 瞬时限流（窗口内曾出现）。",
+                    cooldown_sticky_minutes=cooldown_sticky_minutes,
+                    rate_limit_sticky_minutes=rate_limit_sticky_minutes,
+                )
+                _apply_incident(
+                    matrix,
+                    events,
+                    last_seen,
+                    mid,
+                    now_epoch=now_epoch,
+                    ts_epoch=ts_epoch,
+                    ts_local=ts_local,
+                    kind=kind,
+                    base_status=status,
+                    diagnosis=diag,
+                    sticky_until=sticky_until,
+                    event=f"[{ts_local}] {mid}: {what}",
+                )
             continue
 
-        provider, model, model_id = _extract_provider_model(line)
+        provider, model, model_id = _extract_provider_model(line, lowered)
         resolved = None
         if provider and model:
             resolved = by_provider_model.get((provider, model))
         if resolved:
             model_id = resolved.model_id
-        matched_models = _find_model_refs_in_line(line, models) if not model_id else []
+        matched_models = _find_model_refs_in_line(line, models, model_ids_re, provider_prefixes) if not model_id else []
 
         # Provider-level failures (no model id)
-        nk = NO_API_KEY_RE.search(line)
+        nk = _search(NO_API_KEY_RE, line, lowered)
         if nk:
             p = nk.group("provider")
             events.append(f"[{ts_local}] provider={p}: No API key")
             # Mark all models under this provider as red; this prevents "looks green but cannot run" confusion.
-            for m in models:
-                if m.provider != p:
-                    continue
-                apply(m.model_id, "🔴 配置缺失", "未配置 API key（provider 认证失败）。", None)
+            for m in by_provider.get(p, ()):
+                _apply(matrix, events, m.model_id, "🔴 配置缺失", "未配置 API key（provider 认证失败）。", None)
             continue
 
-        cp = COOLDOWN_PROVIDER_RE.search(line)
+        cp = _search(COOLDOWN_PROVIDER_RE, lowered, lowered)
         if cp and not model_id and not matched_models:
-            p = cp.group("provider")
+            p = _orig_group(line, cp, "provider")
             events.append(f"[{ts_local}] provider={p}: cooldown")
-            for m in models:
-                if m.provider != p:
-                    continue
-                sticky_until = ts + dt.timedelta(minutes=cooldown_sticky_minutes) if ts else None
-                apply_incident(
+            sticky_until = ts_epoch + cooldown_sticky_minutes * 60 if ts_epoch is not None else None
+            for m in by_provider.get(p, ()):
+                _apply_incident(
+                    matrix,
+                    events,
+                    last_seen,
                     m.model_id,
+                    now_epoch=now_epoch,
+                    ts_epoch=ts_epoch,
+                    ts_local=ts_local,
                     kind="provider cooldown",
                     base_status="🟡 瞬时限流",
                     diagnosis="Provider cooldown（该 provider 下所有 profile 不可用）。",
@@ -440,7 +873,7 @@ def parse_llm_status(
             continue
 
         # Model-specific: unknown / not allowed
-        um = UNKNOWN_MODEL_RE.search(line) or MODEL_NOT_ALLOWED_RE.search(line)
+        um = _search(UNKNOWN_MODEL_RE, line, lowered) or _search(MODEL_NOT_ALLOWED_RE, line, lowered)
         if um:
             mid = um.group("model")
             events.append(f"[{ts_local}] model={mid}: Unknown/Not allowed")
@@ -452,7 +885,7 @@ def parse_llm_status(
                     p, mm = "unknown", mid
                 matrix[mid] = {"Provider": p, "Model": mm, "Status": "🔴 模型无效", "Diagnosis": "Unknown model / not allowed"}
             else:
-                apply(mid, "🔴 模型无效", "Unknown model / not allowed", None)
+                _apply(matrix, events, mid, "🔴 模型无效", "Unknown model / not allowed", None)
             continue
 
         # Some errors don't include provider/model fields but do embed model ids.
@@ -464,17 +897,28 @@ def parse_llm_status(
 
         if not model_ids:
             # Keep at least a timeline breadcrumb for rate limits / context limits.
-            lowered = line.lower()
-            if "429" in lowered or "rate_limit" in lowered or CAPACITY_EXHAUSTED_RE.search(line):
-                reset_info = _reset_after_from_text(line)
+            if "429" in lowered or "rate_limit" in lowered or _search(CAPACITY_EXHAUSTED_RE, lowered, lowered):
+                reset_info = _reset_after_from_text(lowered)
                 reset_td = reset_info[0] if reset_info else None
                 reset_raw = reset_info[1] if reset_info else ""
                 recovery = f"预计 {reset_raw} 后重置" if reset_td and reset_raw else ""
                 events.append(f"[{ts_local}] rate_limit(unknown model) {recovery}".strip())
-            elif CONTEXT_LIMIT_RE.search(line):
+            elif _has_any(lowered, CONTEXT_LIMIT_LITERALS):
                 events.append(f"[{ts_local}] token/context limit (unknown model)")
             continue
 
+        # The incident kind is a property of the line, not of each model it mentions.
+        kind = _classify_incident(lowered)
+        details = None
+        if kind:
+            details = _incident_details(
+                kind,
+                lowered,
+                ts_epoch,
+                cooldown_diagnosis="Cooldown / 瞬时限流（窗口内曾出现）。",
+                cooldown_sticky_minutes=cooldown_sticky_minutes,
+                rate_limit_sticky_minutes=rate_limit_sticky_minutes,
+            )
         for mid in model_ids:
             if mid not in matrix:
                 # Observed but not configured; add it so matrix stays truthful.
@@ -483,62 +927,23 @@ def parse_llm_status(
                 else:
                     p, mm = "unknown", mid
                 matrix[mid] = {"Provider": p, "Model": mm, "Status": "🟢 健康", "Diagnosis": "状态稳定，就绪中。"}
-
-            if "cooldown" in lowered or COOLDOWN_PROVIDER_RE.search(line):
-                sticky_until = ts + dt.timedelta(minutes=cooldown_sticky_minutes) if ts else None
-                apply_incident(
-                    mid,
-                    kind="cooldown",
-                    base_status="🟡 瞬时限流",
-                    diagnosis="Cooldown / 瞬时限流（窗口内曾出现）。",
-                    sticky_until=sticky_until,
-                    event=f"[{ts_local}] {mid}: cooldown",
-                )
-            elif "429" in lowered or "rate_limit" in lowered or CAPACITY_EXHAUSTED_RE.search(line):
-                reset_info = _reset_after_from_text(line)
-                reset_td = reset_info[0] if reset_info else None
-                reset_raw = reset_info[1] if reset_info else ""
-                recovery = f"预计 {reset_raw} 后重置" if reset_td and reset_raw else ""
-                if reset_td and reset_td <= dt.timedelta(hours=1):
-                    sticky_until = ts + reset_td if ts else None
-                    status = "🟡 429 限流"
-                    diag = f"429 限流（短期/RPM 可能）。{recovery}".strip()
-                elif reset_td:
-                    sticky_until = ts + reset_td if ts else None
-                    status = "🔴 429 配额/容量限制"
-                    diag = f"429 配额/容量限制（需等待重置）。{recovery}".strip()
-                else:
-                    sticky_until = ts + dt.timedelta(minutes=rate_limit_sticky_minutes) if ts else None
-                    status = "🟡 429 限流"
-                    diag = "429 限流（可能是 RPM/并发）。"
-                apply_incident(
-                    mid,
-                    kind="429/rate_limit",
-                    base_status=status,
-                    diagnosis=diag,
-                    sticky_until=sticky_until,
-                    event=f"[{ts_local}] {mid}: 429/rate_limit {recovery}".strip(),
-                )
-            elif "timeout" in lowered or "etimedout" in lowered:
-                sticky_until = ts + dt.timedelta(minutes=30) if ts else None
-                apply_incident(
-                    mid,
-                    kind="timeout",
-                    base_status="🟡 连接超时",
-                    diagnosis="timeout / ETIMEDOUT（窗口内曾出现）。",
-                    sticky_until=sticky_until,
-                    event=f"[{ts_local}] {mid}: timeout",
-                )
-            elif CONTEXT_LIMIT_RE.search(line):
-                sticky_until = ts + dt.timedelta(hours=6) if ts else None
-                apply_incident(
-                    mid,
-                    kind="token/context limit",
-                    base_status="🟡 Token/上下文上限",
-                    diagnosis="Token/上下文上限触发（窗口内曾出现）。",
-                    sticky_until=sticky_until,
-                    event=f"[{ts_local}] {mid}: token/context limit",
-                )
+            if kind is None or details is None:
+                continue
+            status, diag, sticky_until, what = details
+            _apply_incident(
+                matrix,
+                events,
+                last_seen,
+                mid,
+                now_epoch=now_epoch,
+                ts_epoch=ts_epoch,
+                ts_local=ts_local,
+                kind=kind,
+                base_status=status,
+                diagnosis=diag,
+                sticky_until=sticky_until,
+                event=f"[{ts_local}] {mid}: {what}",
+            )
 
     # Convert to stable row list (provider, model)
     rows = sorted(
@@ -556,44 +961,62 @@ def parse_llm_status(
     )
     for r in rows:
         r.pop("_model_id", None)
-    seen_ev: set[str] = set()
-    uniq_events: list[str] = []
-    for e in events:
-        if e in seen_ev:
-            continue
-        seen_ev.add(e)
-        uniq_events.append(e)
-    return rows, uniq_events[-30:]
+    return rows, events.tolist(), events.window_tolist()
 
 
-def _read_watchdog_events(since_utc: dt.datetime) -> list[dict[str, Any]]:
-    if not WATCHDOG_AUDIT.exists():
-        return []
+# watchdog.py writes json.dumps(event) with "timestamp" as the first key.
+_AUDIT_TS_PREFIXES = (b'{"timestamp": "', b'{"timestamp":"')
+
+
+def _audit_record_epoch(raw: bytes) -> int | None:
+    """UTC epoch seconds read straight from the leading bytes of an audit record, without json.loads."""
+    for prefix in _AUDIT_TS_PREFIXES:
+        if raw.startswith(prefix):
+            n = len(prefix)
+            return _parse_ts_epoch(raw[n : n + 32].decode("ascii", "replace"))
+    return None
+
+
+def _read_watchdog_events(since_epoch: int) -> tuple[list[dict[str, Any]], bool]:
+    """(audit events at or after `since_epoch`, whether the audit file exists at all)."""
     out: list[dict[str, Any]] = []
     try:
-        with WATCHDOG_AUDIT.open("r") as f:
-            for raw in f:
-                try:
-                    d = json.loads(raw)
-                except Exception:
-                    continue
-                ts_raw = str(d.get("timestamp") or "").strip()
-                if not ts_raw:
-                    continue
-                try:
-                    # watchdog uses local naive isoformat; assume local and treat as UTC+0 is wrong.
-                    # If it has offset, fromisoformat keeps it.
-                    ts = dt.datetime.fromisoformat(ts_raw)
-                except Exception:
-                    continue
-                # If naive, assume local time and approximate by treating it as UTC (best effort).
-                if ts.tzinfo is None:
-                    ts = ts.replace(tzinfo=dt.timezone.utc)
-                if ts >= since_utc:
-                    out.append(d)
+        f = WATCHDOG_AUDIT.open("rb")
+    except OSError:
+        return [], False
+    try:
+        with f:
+            if not os.fstat(f.fileno()).st_size:
+                return [], True
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                # The audit log is append-only: walk back from EOF and stop at the first record
+                # that is provably older than the window, so old history is never decoded.
+                for raw in _reverse_lines(mm):
+                    fast_epoch = _audit_record_epoch(raw)
+                    if fast_epoch is not None and fast_epoch < since_epoch:
+                        break
+                    try:
+                        d = _json_loads(raw)
+                    except Exception:
+                        continue
+                    ts_raw = str(d.get("timestamp") or "").strip()
+                    if not ts_raw:
+                        continue
+                    try:
+                        # watchdog uses local naive isoformat; assume local and treat as UTC+0 is wrong.
+                        # If it has offset, fromisoformat keeps it.
+                        ts = dt.datetime.fromisoformat(ts_raw)
+                    except Exception:
+                        continue
+                    # If naive, assume local time and approximate by treating it as UTC (best effort).
+                    if ts.tzinfo is None:
+                        ts = ts.replace(tzinfo=dt.timezone.utc)
+                    if ts.timestamp() >= since_epoch:
+                        out.append(d)
     except Exception:
-        return []
-    return out
+        return [], True
+    out.reverse()
+    return out, True
 
 
 def analyze_restarts(lines: Iterable[str], watchdog_events: list[dict[str, Any]], tz: dt.tzinfo) -> list[dict[str, str]]:
@@ -613,21 +1036,14 @@ def analyze_restarts(lines: Iterable[str], watchdog_events: list[dict[str, Any]]
         wd_restart_times.append(ts)
 
     for line in lines:
-        if "received sigusr1; restarting" in line.lower():
-            ts = _parse_ts_utc(line)
-            if not ts:
-                continue
-            restarts.append((ts, "用户配置变更 (SIGUSR1)"))
-        elif "received sigterm; shutting down" in line.lower():
-            ts = _parse_ts_utc(line)
-            if not ts:
-                continue
-            restarts.append((ts, "系统/服务重启 (SIGTERM)"))
-        elif "uncaught exception" in line.lower() or "max reconnect attempts" in line.lower():
-            ts = _parse_ts_utc(line)
-            if not ts:
-                continue
-            restarts.append((ts, "异常退出/崩溃"))
+        lowered = line.lower()
+        reason = next((r for trigger, r in RESTART_TRIGGERS if trigger in lowered), None)
+        if reason is None:
+            continue
+        ts = _parse_ts_utc(line)
+        if not ts:
+            continue
+        restarts.append((ts, reason))
 
     # Merge near-duplicates (within 90s).
     restarts.sort(key=lambda x: x[0], reverse=True)
@@ -680,18 +1096,60 @@ def read_cron_jobs(tz: dt.tzinfo) -> list[dict[str, Any]]:
     return out
 
 
-def _resolve_runtime_log_paths(gateway_log_lines: list[str]) -> list[Path]:
+def _announced_log_file(gateway_log: Path) -> Path | None:
+    """Runtime log path from the gateway's most recent "[gateway] log file: ..." line."""
+    try:
+        with gateway_log.open("rb") as f:
+            if not os.fstat(f.fileno()).st_size:
+                return None
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                idx = mm.rfind(b"log file:")
+                if idx < 0:
+                    return None
+                end = mm.find(b"\n", idx)
+                tail = mm[idx : end if end >= 0 else len(mm)].decode("utf-8", "replace")
+    except OSError:
+        return None
+    m = LOG_FILE_PATH_RE.match(tail)
+    return Path(m.group("path")) if m else None
+
+
+def _cached_announced_log_file(gateway_log: Path) -> Path | None:
+    """
+    _announced_log_file(), remembered across runs until gateway.log changes.
+
+    This script runs from cron, and gateway.log is usually idle between runs. Keyed on the log's
+    (mtime_ns, size), an unchanged log skips the whole-file scan; every miss records the new key.
+    """
+    try:
+        st = os.stat(gateway_log)
+    except OSError:
+        return None
+    key = [str(gateway_log), st.st_mtime_ns, st.st_size]
+    cached = _read_json(RUNTIME_PATHS_CACHE)
+    if not isinstance(cached, dict):
+        cached = {}
+    cached_path = cached.get("announced")
+    if not isinstance(cached_path, str):
+        cached_path = None
+    if cached.get("key") == key:
+        return Path(cached_path) if cached_path else None
+    announced = _announced_log_file(gateway_log)
+    try:
+        RUNTIME_PATHS_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        RUNTIME_PATHS_CACHE.write_text(json.dumps({"key": key, "announced": str(announced) if announced else None}))
+    except OSError:
+        pass
+    return announced
+
+
+def _resolve_runtime_log_paths(gateway_log: Path) -> list[Path]:
     # Gateway log may include: "[gateway] log file: /tmp/openclaw/openclaw-YYYY-MM-DD.log"
-    last = None
-    for line in reversed(gateway_log_lines):
-        if "log file:" in line:
-            last = line
-            break
+    # It is only printed at startup, so look at the whole file rather than the report window.
     out: list[Path] = []
-    if last:
-        m = re.search(r"log file:\s*(?P<path>/\S+)", last)
-        if m:
-            out.append(Path(m.group("path")))
+    announced = _cached_announced_log_file(gateway_log)
+    if announced:
+        out.append(announced)
 
     # Fallback: standard location.
     tmp_dir = Path("/tmp/openclaw")
@@ -711,29 +1169,52 @@ def _resolve_runtime_log_paths(gateway_log_lines: list[str]) -> list[Path]:
     return uniq
 
 
-def render_markdown(report: dict[str, Any], *, discord: bool = False) -> str:
-    tz_name = report.get("timezone") or ""
-    hours = report.get("window_hours")
-    now_local = report.get("generated_at_local")
+# Section headers per output flavour; Discord gets bold lines instead of Markdown headings.
+_HEADERS_MD = {
+    "infra": "### 🛰️ 基础设施状态",
+    "llm": "### 🧠 LLM 状态矩阵 (按模型)",
+    "events": "### 🔍 异常深度穿透",
+    "cron": "### 🕒 定时任务追踪",
+}
+_HEADERS_DISCORD = {
+    "infra": "**🛰️ 基础设施状态**",
+    "llm": "**🧠 LLM 状态矩阵**",
+    "events": "**🔍 异常深度穿透**",
+    "cron": "**🕒 定时任务追踪**",
+}
+
+# Every job dict from read_cron_jobs() carries these keys.
+_CRON_ROW_FIELDS = operator.itemgetter("name", "enabled", "nextRunLocal")
 
-    lines: list[str] = []
-    lines.append(f"📊 OpenClaw 系统审计报告")
-    lines.append(f"({now_local} | 过去 {hours} 小时 | 时区 {tz_name})")
-    lines.append("")
+
+def render_markdown(
+    *,
+    generated_at_local: str,
+    timezone: str,
+    window_hours: float,
+    restart_count: int,
+    restart_details: list[dict[str, str]],
+    watchdog_status: str,
+    watchdog_event_count: int,
+    matrix_rows: list[dict[str, str]],
+    events: list[str],
+    cron_jobs: list[dict[str, Any]] | None,
+    discord: bool = False,
+) -> str:
+    headers = _HEADERS_DISCORD if discord else _HEADERS_MD
+    lines: list[str] = [
+        "📊 OpenClaw 系统审计报告",
+        f"({generated_at_local} | 过去 {window_hours} 小时 | 时区 {timezone})",
+        "",
+    ]
 
     # 1) Infra
-    if discord:
-        lines.append("**🛰️ 基础设施状态**")
-    else:
-        lines.append("### 🛰️ 基础设施状态")
-    gw = report.get("gateway") or {}
-    restart_count = int(gw.get("restart_count", 0) or 0)
+    lines.append(headers["infra"])
     lines.append(f"- Gateway 重启: {restart_count} 次。")
-    details = gw.get("restart_details") or []
-    if details:
+    if restart_details:
         # Breakdown by reason.
         by_reason: dict[str, int] = {}
-        for d in details:
+        for d in restart_details:
             r = str(d.get("reason") or "").strip() or "未知原因"
             by_reason[r] = by_reason.get(r, 0) + 1
         breakdown = "，".join(f"{k} x{v}" for k, v in sorted(by_reason.items(), key=lambda kv: (-kv[1], kv[0])))
@@ -741,64 +1222,66 @@ def render_markdown(report: dict[str, Any], *, discord: bool = False) -> str:
             lines.append(f"- 重启原因分布: {breakdown}。")
 
         lines.append("- 最近重启明细 (最多 5 条):")
-        for d in details[:5]:
-            lines.append(f"  - [{d.get('timestamp')}] {d.get('reason')}")
-    wd = report.get("watchdog") or {}
-    lines.append(f"- Watchdog: {wd.get('status')}（近 {hours} 小时事件 {wd.get('event_count', 0)} 条）。")
+        lines.append("\n".join([f"  - [{d.get('timestamp')}] {d.get('reason')}" for d in restart_details[:5]]))
+    lines.append(f"- Watchdog: {watchdog_status}（近 {window_hours} 小时事件 {watchdog_event_count} 条）。")
     lines.append("")
 
     # 2) LLM matrix
-    if discord:
-        lines.append("**🧠 LLM 状态矩阵**")
-    else:
-        lines.append("### 🧠 LLM 状态矩阵 (按模型)")
-    rows = report.get("llm_health", {}).get("matrix_rows") or []
+    lines.append(headers["llm"])
     if discord:
         # Discord doesn't render markdown tables; use bullet list instead.
-        for r in rows:
-            status = r.get("状态", "")
-            provider = r.get("Provider", "")
-            model = r.get("模型 (Model)", "")
-            diag = r.get("详细诊断 / 恢复时间", "")
-            lines.append(f"- {status} `{provider}/{model}` — {diag}")
+        if matrix_rows:
+            lines.append(
+                "\n".join(
+                    [
+                        f"- {r.get('状态', '')} `{r.get('Provider', '')}/{r.get('模型 (Model)', '')}` — {r.get('详细诊断 / 恢复时间', '')}"
+                        for r in matrix_rows
+                    ]
+                )
+            )
     else:
-        lines.append("| Provider | 模型 (Model) | 状态 | 详细诊断 / 恢复时间 |")
-        lines.append("| :--- | :--- | :--- | :--- |")
-        for r in rows:
-            lines.append(f"| {r.get('Provider','')} | {r.get('模型 (Model)','')} | {r.get('状态','')} | {r.get('详细诊断 / 恢复时间','')} |")
+        lines.append("| Provider | 模型 (Model) | 状态 | 详细诊断 / 恢复时间 |\n| :--- | :--- | :--- | :--- |")
+        if matrix_rows:
+            lines.append(
+                "\n".join(
+                    [
+                        f"| {r.get('Provider','')} | {r.get('模型 (Model)','')} | {r.get('状态','')} | {r.get('详细诊断 / 恢复时间','')} |"
+                        for r in matrix_rows
+                    ]
+                )
+            )
     lines.append("")
 
     # 3) Deep dive
-    if discord:
-        lines.append("**🔍 异常深度穿透**")
-    else:
-        lines.append("### 🔍 异常深度穿透")
-    events = report.get("llm_health", {}).get("events") or []
+    lines.append(headers["events"])
     if not events:
         lines.append("- 近窗口内未捕获到明确的限流/超时/模型错误事件。")
     else:
         # Show only the most recent events to avoid noisy spam.
-        for e in events[-8:]:
-            lines.append(f"- {e}")
+        lines.append("\n".join([f"- {e}" for e in events[-8:]]))
     lines.append("")
 
-    # 4) Cron
-    if discord:
-        lines.append("**🕒 定时任务追踪**")
-    else:
-        lines.append("### 🕒 定时任务追踪")
-    cron_jobs = report.get("cron", {}).get("jobs") or []
-    if not cron_jobs:
-        lines.append("- 未检测到 Cron 任务。")
-    else:
-        for j in cron_jobs:
-            name = j.get("name")
-            enabled = "运行中" if j.get("enabled") else "已停用"
-            nxt = j.get("nextRunLocal") or "未知"
-            lines.append(f"- {name}: {enabled}，下次运行 {nxt}。")
-    lines.append("")
+    # 4) Cron (None when the caller opted out of it)
+    if cron_jobs is not None:
+        lines.append(headers["cron"])
+        if not cron_jobs:
+            lines.append("- 未检测到 Cron 任务。")
+        else:
+            lines.append(
+                "\n".join(
+                    [
+                        f"- {name}: {'运行中' if enabled else '已停用'}，下次运行 {next_local or '未知'}。"
+                        for name, enabled, next_local in map(_CRON_ROW_FIELDS, cron_jobs)
+                    ]
+                )
+            )
+        lines.append("")
 
-    return "\n".join(lines).rstrip() + "\n"
+    # Every section ends in a blank separator; drop those instead of stripping the joined text.
+    while lines and not lines[-1]:
+        lines.pop()
+    lines.append("")
+    return "\n".join(lines)
 
 
 def main() -> None:
@@ -824,74 +1307,109 @@ def main() -> None:
     )
     ap.add_argument("--tz", type=str, default=None, help='Timezone name (default from config "agents.defaults.userTimezone")')
     ap.add_argument("--format", choices=["json", "md", "discord"], default="json", help="Output format (discord = md without tables)")
+    ap.add_argument("--no-cron", action="store_true", help="Leave the cron section out of the report (cron/jobs.json is not read)")
     args = ap.parse_args()
 
     config = _read_json(CONFIG_FILE) or {}
     tz = _resolve_tz(config, args.tz)
-    now_utc = dt.datetime.now(tz=dt.timezone.utc)
+    # Windows start on whole UTC seconds, so the hot paths compare plain epoch ints.
+    now_utc = dt.datetime.now(tz=dt.timezone.utc).replace(microsecond=0)
+    now_epoch = int(now_utc.timestamp())
     report_hours = max(0.1, float(args.hours))
     llm_hours = float(args.llm_hours) if args.llm_hours is not None else max(report_hours, 24.0)
-    since_report_utc = now_utc - dt.timedelta(hours=report_hours)
-    since_llm_utc = now_utc - dt.timedelta(hours=max(report_hours, llm_hours))
+    since_report_epoch = now_epoch - round(report_hours * 3600)
+    since_llm_epoch = now_epoch - round(max(report_hours, llm_hours) * 3600)
+    since_report_utc = dt.datetime.fromtimestamp(since_report_epoch, _UTC)
+    since_llm_utc = dt.datetime.fromtimestamp(since_llm_epoch, _UTC)
 
     models = get_configured_models(config)
-    # Infra is based on the report window (short).
-    gw_lines_report = get_recent_lines(GATEWAY_LOG, since_report_utc)
-    err_lines_report = get_recent_lines(ERROR_LOG, since_report_utc)
-    runtime_logs = _resolve_runtime_log_paths(gw_lines_report)
+    # LLM health is based on a larger lookback so we don't miss long cooldown/quota events.
+    # The report window is a suffix of it, so each log feeding both is read only once.
+    runtime_logs = _resolve_runtime_log_paths(GATEWAY_LOG)
+    reads = [ERROR_LOG, *runtime_logs]
+    # The reads are independent and mostly I/O-bound; map() hands results back in submission order.
+    with concurrent.futures.ThreadPoolExecutor(max_workers=min(8, len(reads))) as pool:
+        read_lines = list(pool.map(get_recent_lines, reads, itertools.repeat(since_llm_utc)))
+    err_lines_llm = read_lines[0]
+    runtime_lines_llm: list[str] = []
     runtime_lines_report: list[str] = []
-    for p in runtime_logs:
-        runtime_lines_report.extend(get_recent_lines(p, since_report_utc))
-    watchdog_events = _read_watchdog_events(since_report_utc)
-    infra_lines = gw_lines_report + err_lines_report + runtime_lines_report
+    for p_lines in read_lines[1:]:
+        runtime_lines_llm.extend(p_lines)
+        runtime_lines_report.extend(_lines_since(p_lines, since_report_utc))
+
+    # Infra is based on the report window (short). gateway.log only feeds restart detection, so
+    # it is streamed straight into it instead of being materialized.
+    err_lines_report = _lines_since(err_lines_llm, since_report_utc)
+    watchdog_events, watchdog_present = _read_watchdog_events(since_report_epoch)
+    watchdog_status = "audit-present" if watchdog_present else "audit-missing"
+    infra_lines = itertools.chain(_tail_since(GATEWAY_LOG, since_report_utc), err_lines_report, runtime_lines_report)
     restart_details = analyze_restarts(infra_lines, watchdog_events, tz)
 
-    # LLM health is based on a larger lookback so we don't miss long cooldown/quota events.
-    err_lines_llm = get_recent_lines(ERROR_LOG, since_llm_utc)
-    runtime_lines_llm: list[str] = []
-    for p in runtime_logs:
-        runtime_lines_llm.extend(get_recent_lines(p, since_llm_utc))
-    llm_lines = err_lines_llm + runtime_lines_llm
-    matrix_rows, events = parse_llm_status(
-        llm_lines,
-        models,
-        tz,
-        now_utc=now_utc,
-        cooldown_sticky_minutes=int(args.cooldown_sticky_minutes),
-        rate_limit_sticky_minutes=int(args.rate_limit_sticky_minutes),
-    )
+    llm_lines = itertools.chain(err_lines_llm, runtime_lines_llm)
     # Deep-dive list should be recent, not the whole lookback window.
-    _, events_recent = parse_llm_status(
-        err_lines_report + runtime_lines_report,
+    matrix_rows, _, events_recent = parse_llm_status(
+        llm_lines,
         models,
         tz,
-        now_utc=now_utc,
+        now_epoch=now_epoch,
         cooldown_sticky_minutes=int(args.cooldown_sticky_minutes),
         rate_limit_sticky_minutes=int(args.rate_limit_sticky_minutes),
+        recent_since_epoch=since_report_epoch,
     )
 
-    report: dict[str, Any] = {
-        "generated_at_local": now_utc.astimezone(tz).strftime("%Y-%m-%d %H:%M"),
-        "timezone": getattr(tz, "key", str(tz)),
-        "window_hours": float(args.hours),
-        "gateway": {"restart_count": len(restart_details), "restart_details": restart_details[:10]},
-        "watchdog": {
-            "status": "audit-present" if WATCHDOG_AUDIT.exists() else "audit-missing",
-            "event_count": len(watchdog_events),
-        },
-        "llm_health": {
-            "matrix_rows": matrix_rows,
-            "events": events_recent,
-            "_llm_lookback_hours": llm_hours,
-            "_cooldown_sticky_minutes": int(args.cooldown_sticky_minutes),
-        },
-        "cron": {"jobs": read_cron_jobs(tz)},
-    }
+    generated_at_local = now_utc.astimezone(tz).strftime("%Y-%m-%d %H:%M")
+    tz_name = getattr(tz, "key", str(tz))
+    cron_jobs = None if args.no_cron else read_cron_jobs(tz)
 
     if args.format in ("md", "discord"):
-        print(render_markdown(report, discord=(args.format == "discord")), end="")
+        # Markdown only needs these values; skip assembling the JSON document.
+        md = render_markdown(
+            generated_at_local=generated_at_local,
+            timezone=tz_name,
+            window_hours=float(args.hours),
+            restart_count=len(restart_details),
+            restart_details=restart_details[:10],
+            watchdog_status=watchdog_status,
+            watchdog_event_count=len(watchdog_events),
+            matrix_rows=matrix_rows,
+            events=events_recent,
+            cron_jobs=cron_jobs,
+            discord=(args.format == "discord"),
+        )
+        sys.stdout.write(md)
     else:
-        print(json.dumps(report, ensure_ascii=False, indent=2))
+        report: dict[str, Any] = {
+            "generated_at_local": generated_at_local,
+            "timezone": tz_name,
+            "window_hours": float(args.hours),
+            "gateway": {"restart_count": len(restart_details), "restart_details": restart_details[:10]},
+            "watchdog": {
+                "status": watchdog_status,
+                "event_count": len(watchdog_events),
+            },
+            "llm_health": {
+                "matrix_rows": matrix_rows,
+                "events": events_recent,
+                "_llm_lookback_hours": llm_hours,
+                "_cooldown_sticky_minutes": int(args.cooldown_sticky_minutes),
+            },
+        }
+        if cron_jobs is not None:
+            report["cron"] = {"jobs": cron_jobs}
+        out = None
+        if orjson is not None:
+            try:
+                out = orjson.dumps(report, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+            except TypeError:  # e.g. integers outside 64 bits in a cron job's schedule
+                out = None
+        if out is not None:
+            # Already UTF-8 bytes, same layout as json.dump(..., ensure_ascii=False, indent=2).
+            sys.stdout.flush()
+            sys.stdout.buffer.write(out)
+        else:
+            # Stream straight into stdout rather than building the whole document as one string first.
+            json.dump(report, sys.stdout, ensure_ascii=False, indent=2)
+            sys.stdout.write("\n")
 
 
 if __name__ == "__main__":